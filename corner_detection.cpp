@@ -62,13 +62,12 @@ bool detectAndDrawCorners(const std::string& inputFolder,
                             cv::cornerSubPix(gray, corners, cv::Size(11, 11), cv::Size(-1, -1),
                                 cv::TermCriteria(cv::TermCriteria::EPS + cv::TermCriteria::COUNT, 30, 0.1));
 
-                            // Draw corners on image
-                            cv::Mat imageWithCorners = image.clone();
-                            cv::drawChessboardCorners(imageWithCorners, boardSize, corners, found);
+                            // Draw corners on image (in place, the original is not reused)
+                            cv::drawChessboardCorners(image, boardSize, corners, found);
 
                             // Save image with corners
                             std::string outputImagePath = outputFolder + "/corner_images/" + entry.path().filename().string();
-                            cv::imwrite(outputImagePath, imageWithCorners);
+                            cv::imwrite(outputImagePath, image);
 
                             // Store corners and image info
                             allCorners.push_back(corners);
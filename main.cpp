@@ -8,6 +8,7 @@
 #include <iostream>
 #include <fstream>
 #include <filesystem>
+#include <future>
 
 /**
  * 相机标定和3D重建流程 - 使用8.2mm棋盘格边长
@@ -49,17 +50,23 @@ int main() {
     std::cout << "第1步：图像预处理 - 裁剪为3264×2448像素" << std::endl;
     std::cout << "Step 1: Image Preprocessing - Crop to 3264×2448 pixels" << std::endl;
     
-    bool success1 = ImageUtils::resizeImage(
-        "calibration_data/input/left",
-        "calibration_data/output/step1_left_resized",
-        imageWidth, imageHeight, ImageUtils::LINEAR
-    );
+    // 第1-3步中左右相机互不依赖，并行处理
+    // Steps 1-3 run left and right in parallel (they share OpenCV's global thread pool)
+
+    auto leftResize = std::async(std::launch::async, [&]() {
+        return ImageUtils::resizeImage(
+            "calibration_data/input/left",
+            "calibration_data/output/step1_left_resized",
+            imageWidth, imageHeight, ImageUtils::LINEAR
+        );
+    });
 
     bool success2 = ImageUtils::resizeImage(
         "calibration_data/input/right",
         "calibration_data/output/step1_right_resized", 
         imageWidth, imageHeight, ImageUtils::LINEAR
     );
+    bool success1 = leftResize.get();
 
     if (success1 && success2) {
         std::cout << "✓ 第1步完成：图像预处理成功 (Step 1 completed: Image preprocessing successful)" << std::endl;
@@ -73,17 +80,20 @@ int main() {
     std::cout << "第2步：角点检测与可视化" << std::endl;
     std::cout << "Step 2: Corner Detection and Visualization" << std::endl;
     
-    bool success3 = detectAndDrawCorners(
-        "calibration_data/output/step1_left_resized",
-        "calibration_data/output/step2_left_corners",
-        boardWidth, boardHeight, 1.0f
-    );
+    auto leftCorners = std::async(std::launch::async, [&]() {
+        return detectAndDrawCorners(
+            "calibration_data/output/step1_left_resized",
+            "calibration_data/output/step2_left_corners",
+            boardWidth, boardHeight, 1.0f
+        );
+    });
 
     bool success4 = detectAndDrawCorners(
         "calibration_data/output/step1_right_resized",
         "calibration_data/output/step2_right_corners",
         boardWidth, boardHeight, 1.0f
     );
+    bool success3 = leftCorners.get();
 
     if (success3 && success4) {
         std::cout << "✓ 第2步完成：角点检测与可视化成功 (Step 2 completed: Corner detection and visualization successful)" << std::endl;
@@ -96,15 +106,19 @@ int main() {
     std::cout << "第3步：单目标定（左右相机分别标定）" << std::endl;
     std::cout << "Step 3: Monocular Calibration (Left and Right Cameras Separately)" << std::endl;
     
-    bool success5 = MonoCalibration::calibrateCamera(
-        "calibration_data/output/step2_left_corners",
-        "calibration_data/output/step1_left_resized",
-        "calibration_data/output/step3_left_calibration",
-        boardWidth, boardHeight, squareSize,
-        imageWidth, imageHeight,
-        true,  // 保存矫正图像 (Save corrected images)
-        "calibration_data/output/step3_left_corrected"
-    );
+    // saveCalibrationData 使用可重入的时间格式化，左右可同时保存
+    // (saveCalibrationData formats calibration_time reentrantly, so both halves may save concurrently)
+    auto leftCalibration = std::async(std::launch::async, [&]() {
+        return MonoCalibration::calibrateCamera(
+            "calibration_data/output/step2_left_corners",
+            "calibration_data/output/step1_left_resized",
+            "calibration_data/output/step3_left_calibration",
+            boardWidth, boardHeight, squareSize,
+            imageWidth, imageHeight,
+            true,  // 保存矫正图像 (Save corrected images)
+            "calibration_data/output/step3_left_corrected"
+        );
+    });
 
     bool success6 = MonoCalibration::calibrateCamera(
         "calibration_data/output/step2_right_corners",
@@ -115,6 +129,7 @@ int main() {
         true,  // 保存矫正图像 (Save corrected images) 
         "calibration_data/output/step3_right_corrected"
     );
+    bool success5 = leftCalibration.get();
 
     if (success5 && success6) {
         std::cout << "✓ 第3步完成：单目标定成功 (Step 3 completed: Monocular calibration successful)" << std::endl;
@@ -176,58 +176,51 @@ bool generateProjectionViews(const std::vector<cv::Point3f>& points,
 
         int imageSize = 800;
 
-        // Generate XY view (front view)
+        // Compute scales for XY (front), XZ (top) and YZ (side) views
         cv::Mat xyView = cv::Mat::zeros(imageSize, imageSize, CV_8UC3);
+        cv::Mat xzView = cv::Mat::zeros(imageSize, imageSize, CV_8UC3);
+        cv::Mat yzView = cv::Mat::zeros(imageSize, imageSize, CV_8UC3);
         float rangeX = maxPoint.x - minPoint.x;
         float rangeY = maxPoint.y - minPoint.y;
+        float rangeZ = maxPoint.z - minPoint.z;
         
         if (rangeX <= 0) rangeX = 1.0f;  // Prevent division by zero
         if (rangeY <= 0) rangeY = 1.0f;  // Prevent division by zero
+        if (rangeZ <= 0) rangeZ = 1.0f;  // Prevent division by zero
         
         float scaleX = imageSize / rangeX;
         float scaleY = imageSize / rangeY;
+        float scaleZ = imageSize / rangeZ;
         float xyScale = std::min(scaleX, scaleY) * 0.9f;
+        float xzScale = std::min(scaleX, scaleZ) * 0.9f;
+        float yzScale = std::min(scaleY, scaleZ) * 0.9f;
+        float margin = imageSize * 0.05f;
 
+        // Draw all three views in a single pass over the points
         for (size_t i = 0; i < points.size(); i++) {
-            int x = static_cast<int>((points[i].x - minPoint.x) * xyScale + imageSize * 0.05f);
-            int y = static_cast<int>((maxPoint.y - points[i].y) * xyScale + imageSize * 0.05f);  // Flip Y
-            
+            const cv::Point3f& p = points[i];
+            cv::Vec3b color = colors.size() > i ? colors[i] : cv::Vec3b(255, 255, 255);
+            cv::Scalar drawColor(color[0], color[1], color[2]);
+
+            // XY view
+            int x = static_cast<int>((p.x - minPoint.x) * xyScale + margin);
+            int y = static_cast<int>((maxPoint.y - p.y) * xyScale + margin);  // Flip Y
             if (x >= 0 && x < imageSize && y >= 0 && y < imageSize) {
-                cv::Vec3b color = colors.size() > i ? colors[i] : cv::Vec3b(255, 255, 255);
-                cv::circle(xyView, cv::Point(x, y), 1, cv::Scalar(color[0], color[1], color[2]), -1);
+                cv::circle(xyView, cv::Point(x, y), 1, drawColor, -1);
             }
-        }
 
-        // Generate XZ view (top view)
-        cv::Mat xzView = cv::Mat::zeros(imageSize, imageSize, CV_8UC3);
-        float rangeZ = maxPoint.z - minPoint.z;
-        
-        if (rangeZ <= 0) rangeZ = 1.0f;  // Prevent division by zero
-        
-        float scaleZ = imageSize / rangeZ;
-        float xzScale = std::min(scaleX, scaleZ) * 0.9f;
-
-        for (size_t i = 0; i < points.size(); i++) {
-            int x = static_cast<int>((points[i].x - minPoint.x) * xzScale + imageSize * 0.05f);
-            int z = static_cast<int>((points[i].z - minPoint.z) * xzScale + imageSize * 0.05f);
-            
+            // XZ view
+            x = static_cast<int>((p.x - minPoint.x) * xzScale + margin);
+            int z = static_cast<int>((p.z - minPoint.z) * xzScale + margin);
             if (x >= 0 && x < imageSize && z >= 0 && z < imageSize) {
-                cv::Vec3b color = colors.size() > i ? colors[i] : cv::Vec3b(255, 255, 255);
-                cv::circle(xzView, cv::Point(x, z), 1, cv::Scalar(color[0], color[1], color[2]), -1);
+                cv::circle(xzView, cv::Point(x, z), 1, drawColor, -1);
             }
-        }
-
-        // Generate YZ view (side view)
-        cv::Mat yzView = cv::Mat::zeros(imageSize, imageSize, CV_8UC3);
-        float yzScale = std::min(scaleY, scaleZ) * 0.9f;
 
-        for (size_t i = 0; i < points.size(); i++) {
-            int y = static_cast<int>((maxPoint.y - points[i].y) * yzScale + imageSize * 0.05f);  // Flip Y
-            int z = static_cast<int>((points[i].z - minPoint.z) * yzScale + imageSize * 0.05f);
-            
+            // YZ view
+            y = static_cast<int>((maxPoint.y - p.y) * yzScale + margin);  // Flip Y
+            z = static_cast<int>((p.z - minPoint.z) * yzScale + margin);
             if (y >= 0 && y < imageSize && z >= 0 && z < imageSize) {
-                cv::Vec3b color = colors.size() > i ? colors[i] : cv::Vec3b(255, 255, 255);
-                cv::circle(yzView, cv::Point(z, y), 1, cv::Scalar(color[0], color[1], color[2]), -1);
+                cv::circle(yzView, cv::Point(z, y), 1, drawColor, -1);
             }
         }
 
@@ -1,5 +1,6 @@
 #include "mono_calibration.h"
 #include <iostream>
+#include <ctime>
 #include <filesystem>
 #include <vector>
 
@@ -38,19 +39,16 @@ bool calibrateCamera(const std::string& cornerDataPath,
             return false;
         }
 
-        // Create 3D object points
-        std::vector<std::vector<cv::Point3f>> objectPoints;
+        // Create 3D object points (the board pattern is the same for every view)
         cv::Size boardSize(boardWidth, boardHeight);
-        
-        for (size_t i = 0; i < imagePoints.size(); i++) {
-            std::vector<cv::Point3f> corners3D;
-            for (int y = 0; y < boardHeight; y++) {
-                for (int x = 0; x < boardWidth; x++) {
-                    corners3D.push_back(cv::Point3f(x * squareSize, y * squareSize, 0));
-                }
+        std::vector<cv::Point3f> corners3D;
+        corners3D.reserve(boardSize.area());
+        for (int y = 0; y < boardHeight; y++) {
+            for (int x = 0; x < boardWidth; x++) {
+                corners3D.push_back(cv::Point3f(x * squareSize, y * squareSize, 0));
             }
-            objectPoints.push_back(corners3D);
         }
+        std::vector<std::vector<cv::Point3f>> objectPoints(imagePoints.size(), corners3D);
 
         // Camera calibration
         cv::Mat cameraMatrix = cv::Mat::eye(3, 3, CV_64F);
@@ -152,9 +150,19 @@ bool saveCalibrationData(const std::string& calibrationFile,
         fs << "reprojection_error" << reprojectionError;
         
         // Save additional info
+        // (reentrant localtime_r/localtime_s + strftime: left/right calibration may run concurrently,
+        //  asctime/localtime share static buffers)
         time_t rawtime;
         time(&rawtime);
-        fs << "calibration_time" << asctime(localtime(&rawtime));
+        struct tm timeInfo;
+#ifdef _WIN32
+        localtime_s(&timeInfo, &rawtime);
+#else
+        localtime_r(&rawtime, &timeInfo);
+#endif
+        char timeBuffer[64];
+        strftime(timeBuffer, sizeof(timeBuffer), "%a %b %e %H:%M:%S %Y\n", &timeInfo);  // asctime format
+        fs << "calibration_time" << timeBuffer;
 
         fs.release();
         return true;
@@ -203,6 +211,22 @@ bool generateResidualImages(const std::string& cornerDataPath,
             return false;
         }
 
+        // List the image folder once instead of rescanning it for every image index
+        std::vector<std::filesystem::path> folderFiles;
+        std::string firstImagePath;
+        for (const auto& entry : std::filesystem::directory_iterator(imageFolderPath)) {
+            if (entry.is_regular_file()) {
+                folderFiles.push_back(entry.path());
+                if (firstImagePath.empty()) {
+                    std::string ext = entry.path().extension().string();
+                    std::transform(ext.begin(), ext.end(), ext.begin(), ::tolower);
+                    if (ext == ".jpg" || ext == ".jpeg" || ext == ".png" || ext == ".bmp") {
+                        firstImagePath = entry.path().string();
+                    }
+                }
+            }
+        }
+
         int residualCount = 0;
         double totalError = 0.0;
 
@@ -215,12 +239,15 @@ bool generateResidualImages(const std::string& cornerDataPath,
 
             // Calculate reprojection errors for this image
             std::vector<float> errors;
+            errors.reserve(imagePoints[imgIdx].size());
             float maxError = 0.0f;
+            float imageError = 0.0f;
             for (size_t ptIdx = 0; ptIdx < imagePoints[imgIdx].size(); ptIdx++) {
                 cv::Point2f diff = imagePoints[imgIdx][ptIdx] - projectedPoints[ptIdx];
                 float error = sqrt(diff.x * diff.x + diff.y * diff.y);
                 errors.push_back(error);
                 maxError = std::max(maxError, error);
+                imageError += error;
                 totalError += error;
             }
 
@@ -229,29 +256,18 @@ bool generateResidualImages(const std::string& cornerDataPath,
             std::string imagePath;
             
             // Try to find the corresponding image file
-            for (const auto& entry : std::filesystem::directory_iterator(imageFolderPath)) {
-                if (entry.is_regular_file()) {
-                    std::string filename = entry.path().filename().string();
-                    if (filename.find(std::to_string(imgIdx)) != std::string::npos ||
-                        imgIdx == 0) { // Use first available image as fallback
-                        imagePath = entry.path().string();
-                        break;
-                    }
+            for (const auto& file : folderFiles) {
+                std::string filename = file.filename().string();
+                if (filename.find(std::to_string(imgIdx)) != std::string::npos ||
+                    imgIdx == 0) { // Use first available image as fallback
+                    imagePath = file.string();
+                    break;
                 }
             }
 
             if (imagePath.empty()) {
                 // Fallback: use first available image
-                for (const auto& entry : std::filesystem::directory_iterator(imageFolderPath)) {
-                    if (entry.is_regular_file()) {
-                        std::string ext = entry.path().extension().string();
-                        std::transform(ext.begin(), ext.end(), ext.begin(), ::tolower);
-                        if (ext == ".jpg" || ext == ".jpeg" || ext == ".png" || ext == ".bmp") {
-                            imagePath = entry.path().string();
-                            break;
-                        }
-                    }
-                }
+                imagePath = firstImagePath;
             }
 
             if (imagePath.empty()) {
@@ -265,8 +281,8 @@ bool generateResidualImages(const std::string& cornerDataPath,
                 continue;
             }
 
-            // Create residual error visualization
-            cv::Mat errorVis = image.clone();
+            // Create residual error visualization (draws over the loaded image, no copy)
+            cv::Mat errorVis = image;
 
             // Draw detected corners in green
             for (size_t ptIdx = 0; ptIdx < imagePoints[imgIdx].size(); ptIdx++) {
@@ -293,9 +309,7 @@ bool generateResidualImages(const std::string& cornerDataPath,
             cv::putText(errorVis, "Green: Detected, Red: Projected", 
                        cv::Point(10, 30), cv::FONT_HERSHEY_SIMPLEX, 0.7, cv::Scalar(255, 255, 255), 2);
             
-            float avgError = 0;
-            for (float err : errors) avgError += err;
-            avgError /= errors.size();
+            float avgError = imageError / errors.size();
             
             std::string errorText = "Avg Error: " + std::to_string(avgError) + " px";
             cv::putText(errorVis, errorText, cv::Point(10, 60), 
@@ -1,5 +1,6 @@
 #include "stereo_calibration.h"
 #include <iostream>
+#include <ctime>
 #include <filesystem>
 #include <vector>
 
@@ -49,19 +50,16 @@ bool calibrateStereoCamera(const std::string& leftCornerDataPath,
             return false;
         }
 
-        // Create 3D object points
-        std::vector<std::vector<cv::Point3f>> objectPoints;
+        // Create 3D object points (the board pattern is the same for every view)
         cv::Size boardSize(boardWidth, boardHeight);
-        
-        for (size_t i = 0; i < leftImagePoints.size(); i++) {
-            std::vector<cv::Point3f> corners3D;
-            for (int y = 0; y < boardHeight; y++) {
-                for (int x = 0; x < boardWidth; x++) {
-                    corners3D.push_back(cv::Point3f(x * squareSize, y * squareSize, 0));
-                }
+        std::vector<cv::Point3f> corners3D;
+        corners3D.reserve(boardSize.area());
+        for (int y = 0; y < boardHeight; y++) {
+            for (int x = 0; x < boardWidth; x++) {
+                corners3D.push_back(cv::Point3f(x * squareSize, y * squareSize, 0));
             }
-            objectPoints.push_back(corners3D);
         }
+        std::vector<std::vector<cv::Point3f>> objectPoints(leftImagePoints.size(), corners3D);
 
         // Initialize camera matrices and distortion coefficients
         cv::Mat leftCameraMatrix = cv::Mat::eye(3, 3, CV_64F);
@@ -183,9 +181,18 @@ bool saveStereoCalibrationData(const std::string& calibrationFile,
         fs << "reprojection_error" << reprojectionError;
         
         // Save additional info
+        // (same calibration_time formatting as MonoCalibration::saveCalibrationData)
         time_t rawtime;
         time(&rawtime);
-        fs << "calibration_time" << asctime(localtime(&rawtime));
+        struct tm timeInfo;
+#ifdef _WIN32
+        localtime_s(&timeInfo, &rawtime);
+#else
+        localtime_r(&rawtime, &timeInfo);
+#endif
+        char timeBuffer[64];
+        strftime(timeBuffer, sizeof(timeBuffer), "%a %b %e %H:%M:%S %Y\n", &timeInfo);  // asctime format
+        fs << "calibration_time" << timeBuffer;
 
         fs.release();
         return true;
@@ -226,6 +233,24 @@ bool rectifyStereoPair(const cv::Mat& leftImage, const cv::Mat& rightImage,
         rectifyFs["P2"] >> P2;
         rectifyFs.release();
 
+        return rectifyStereoPair(leftImage, rightImage, rectifiedLeft, rectifiedRight,
+                                 leftCameraMatrix, leftDistCoeffs,
+                                 rightCameraMatrix, rightDistCoeffs,
+                                 R1, R2, P1, P2);
+
+    } catch (const std::exception& e) {
+        std::cerr << "Error rectifying stereo pair: " << e.what() << std::endl;
+        return false;
+    }
+}
+
+bool rectifyStereoPair(const cv::Mat& leftImage, const cv::Mat& rightImage,
+                      cv::Mat& rectifiedLeft, cv::Mat& rectifiedRight,
+                      const cv::Mat& leftCameraMatrix, const cv::Mat& leftDistCoeffs,
+                      const cv::Mat& rightCameraMatrix, const cv::Mat& rightDistCoeffs,
+                      const cv::Mat& R1, const cv::Mat& R2,
+                      const cv::Mat& P1, const cv::Mat& P2) {
+    try {
         // Compute rectification maps
         cv::Mat leftMapX, leftMapY, rightMapX, rightMapY;
         cv::initUndistortRectifyMap(leftCameraMatrix, leftDistCoeffs, R1, P1,
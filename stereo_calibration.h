@@ -78,6 +78,29 @@ namespace StereoCalibration {
     bool rectifyStereoPair(const cv::Mat& leftImage, const cv::Mat& rightImage,
                           cv::Mat& rectifiedLeft, cv::Mat& rectifiedRight,
                           const std::string& calibrationFile);
+
+    /**
+     * Rectify stereo image pair using already loaded calibration parameters
+     * @param leftImage Left camera image
+     * @param rightImage Right camera image
+     * @param rectifiedLeft Output rectified left image
+     * @param rectifiedRight Output rectified right image
+     * @param leftCameraMatrix Left camera matrix
+     * @param leftDistCoeffs Left distortion coefficients
+     * @param rightCameraMatrix Right camera matrix
+     * @param rightDistCoeffs Right distortion coefficients
+     * @param R1 Left rectification rotation
+     * @param R2 Right rectification rotation
+     * @param P1 Left rectified projection matrix
+     * @param P2 Right rectified projection matrix
+     * @return true if successful
+     */
+    bool rectifyStereoPair(const cv::Mat& leftImage, const cv::Mat& rightImage,
+                          cv::Mat& rectifiedLeft, cv::Mat& rectifiedRight,
+                          const cv::Mat& leftCameraMatrix, const cv::Mat& leftDistCoeffs,
+                          const cv::Mat& rightCameraMatrix, const cv::Mat& rightDistCoeffs,
+                          const cv::Mat& R1, const cv::Mat& R2,
+                          const cv::Mat& P1, const cv::Mat& P2);
 }
 
 #endif // STEREO_CALIBRATION_H
\ No newline at end of file
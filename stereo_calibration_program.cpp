@@ -21,6 +21,7 @@
 #include <iostream>
 #include <string>
 #include <filesystem>
+#include <future>
 
 class StereoCalibrationProgram {
 private:
@@ -146,18 +147,15 @@ private:
     }
     
     void createOutputDirectories() {
-        std::filesystem::create_directories(outputPath);
-        std::filesystem::create_directories(outputPath + "/preprocessed");
+        // 只创建叶子目录，父目录由create_directories一并创建
+        // Only leaf directories are listed; create_directories makes their parents
         std::filesystem::create_directories(outputPath + "/preprocessed/left");
         std::filesystem::create_directories(outputPath + "/preprocessed/right");
-        std::filesystem::create_directories(outputPath + "/corners");
         std::filesystem::create_directories(outputPath + "/corners/left");
         std::filesystem::create_directories(outputPath + "/corners/right");
-        std::filesystem::create_directories(outputPath + "/calibration");
         std::filesystem::create_directories(outputPath + "/calibration/left");
         std::filesystem::create_directories(outputPath + "/calibration/right");
         std::filesystem::create_directories(outputPath + "/calibration/stereo");
-        std::filesystem::create_directories(outputPath + "/rectified");
         std::filesystem::create_directories(outputPath + "/rectified/left");
         std::filesystem::create_directories(outputPath + "/rectified/right");
         std::filesystem::create_directories(outputPath + "/3d_model");
@@ -167,12 +165,15 @@ private:
         std::cout << "\n步骤1: 图像预处理 (Image Preprocessing)" << std::endl;
         std::cout << "目标尺寸: " << imageWidth << "×" << imageHeight << " 像素" << std::endl;
         
-        bool leftSuccess = ImageUtils::resizeImage(
-            leftImagePath,
-            outputPath + "/preprocessed/left",
-            imageWidth, imageHeight,
-            ImageUtils::LINEAR
-        );
+        // 左右相机互不依赖，并行处理 (Left and right are independent, run in parallel)
+        auto leftTask = std::async(std::launch::async, [this]() {
+            return ImageUtils::resizeImage(
+                leftImagePath,
+                outputPath + "/preprocessed/left",
+                imageWidth, imageHeight,
+                ImageUtils::LINEAR
+            );
+        });
         
         bool rightSuccess = ImageUtils::resizeImage(
             rightImagePath,
@@ -180,6 +181,7 @@ private:
             imageWidth, imageHeight,
             ImageUtils::LINEAR
         );
+        bool leftSuccess = leftTask.get();
         
         if (leftSuccess && rightSuccess) {
             std::cout << "✓ 图像预处理完成" << std::endl;
@@ -192,17 +194,21 @@ private:
         std::cout << "\n步骤2: 角点检测 (Corner Detection)" << std::endl;
         std::cout << "棋盘格规格: " << boardWidth << "×" << boardHeight << " 内角点" << std::endl;
         
-        bool leftSuccess = detectAndDrawCorners(
-            outputPath + "/preprocessed/left",
-            outputPath + "/corners/left",
-            boardWidth, boardHeight, 1.0f
-        );
+        // 左右相机互不依赖，并行处理 (Left and right are independent, run in parallel)
+        auto leftTask = std::async(std::launch::async, [this]() {
+            return detectAndDrawCorners(
+                outputPath + "/preprocessed/left",
+                outputPath + "/corners/left",
+                boardWidth, boardHeight, 1.0f
+            );
+        });
         
         bool rightSuccess = detectAndDrawCorners(
             outputPath + "/preprocessed/right",
             outputPath + "/corners/right",
             boardWidth, boardHeight, 1.0f
         );
+        bool leftSuccess = leftTask.get();
         
         if (leftSuccess && rightSuccess) {
             std::cout << "✓ 角点检测完成" << std::endl;
@@ -214,15 +220,18 @@ private:
     bool calibrateMonocular() {
         std::cout << "\n步骤3: 单目标定 (Monocular Calibration)" << std::endl;
         
-        bool leftSuccess = MonoCalibration::calibrateCamera(
-            outputPath + "/corners/left",
-            outputPath + "/preprocessed/left",
-            outputPath + "/calibration/left",
-            boardWidth, boardHeight, squareSize,
-            imageWidth, imageHeight,
-            true,  // 生成矫正图像
-            outputPath + "/calibration/left/undistorted"
-        );
+        // 左右相机互不依赖，并行标定 (Left and right are independent, calibrate in parallel)
+        auto leftTask = std::async(std::launch::async, [this]() {
+            return MonoCalibration::calibrateCamera(
+                outputPath + "/corners/left",
+                outputPath + "/preprocessed/left",
+                outputPath + "/calibration/left",
+                boardWidth, boardHeight, squareSize,
+                imageWidth, imageHeight,
+                true,  // 生成矫正图像
+                outputPath + "/calibration/left/undistorted"
+            );
+        });
         
         bool rightSuccess = MonoCalibration::calibrateCamera(
             outputPath + "/corners/right",
@@ -233,6 +242,7 @@ private:
             true,  // 生成矫正图像
             outputPath + "/calibration/right/undistorted"
         );
+        bool leftSuccess = leftTask.get();
         
         if (leftSuccess && rightSuccess) {
             std::cout << "✓ 单目标定完成" << std::endl;
@@ -269,10 +279,11 @@ private:
         
         // 这里应该实现立体校正功能
         // 目前使用单目矫正的结果作为临时替代
-        std::filesystem::create_directories(outputPath + "/rectified/left");
-        std::filesystem::create_directories(outputPath + "/rectified/right");
+        // (rectified/left 和 rectified/right 已在 createOutputDirectories 中创建)
         
         // 复制单目矫正结果到立体校正目录
+        // (必须是独立副本而非硬链接：实现真正的立体校正后会直接覆盖rectified/中的文件)
+        // (Independent copies, not hard links: real rectification will overwrite files in rectified/)
         try {
             std::string leftUndistorted = outputPath + "/calibration/left/undistorted";
             std::string rightUndistorted = outputPath + "/calibration/right/undistorted";
@@ -3,6 +3,7 @@
 #include <iostream>
 #include <filesystem>
 #include <fstream>
+#include <vector>
 
 namespace StereoReconstruction {
 
@@ -43,11 +44,29 @@ bool reconstruct3D(const std::string& leftImagePath,
             return false;
         }
 
+        // Load rectification data (R1, R2, P1, P2 and the Q matrix) once
+        std::string rectifyFile = calibrationPath + "/stereo_rectify.yml";
+        cv::FileStorage rectifyFs(rectifyFile, cv::FileStorage::READ);
+        cv::Mat R1, R2, P1, P2, Q;
+        if (rectifyFs.isOpened()) {
+            rectifyFs["R1"] >> R1;
+            rectifyFs["R2"] >> R2;
+            rectifyFs["P1"] >> P1;
+            rectifyFs["P2"] >> P2;
+            rectifyFs["Q"] >> Q;
+            rectifyFs.release();
+        } else {
+            std::cerr << "Failed to open rectification file: " << rectifyFile << std::endl;
+            return false;
+        }
+
         // Rectify stereo pair
         cv::Mat rectifiedLeft, rectifiedRight;
         if (!StereoCalibration::rectifyStereoPair(leftImage, rightImage,
                                                  rectifiedLeft, rectifiedRight,
-                                                 calibFile)) {
+                                                 leftCameraMatrix, leftDistCoeffs,
+                                                 rightCameraMatrix, rightDistCoeffs,
+                                                 R1, R2, P1, P2)) {
             std::cerr << "Failed to rectify stereo pair" << std::endl;
             return false;
         }
@@ -72,17 +91,6 @@ bool reconstruct3D(const std::string& leftImagePath,
         cv::normalize(disparityMap, disparityVis, 0, 255, cv::NORM_MINMAX, CV_8U);
         cv::imwrite(outputPath + "/disparity_map.jpg", disparityVis);
 
-        // Load Q matrix for 3D reconstruction
-        cv::FileStorage rectifyFs(calibrationPath + "/stereo_rectify.yml", cv::FileStorage::READ);
-        cv::Mat Q;
-        if (rectifyFs.isOpened()) {
-            rectifyFs["Q"] >> Q;
-            rectifyFs.release();
-        } else {
-            std::cerr << "Failed to load Q matrix from rectification data" << std::endl;
-            return false;
-        }
-
         // Generate 3D point cloud
         std::vector<cv::Point3f> pointCloud;
         std::vector<cv::Vec3b> colors;
@@ -181,23 +189,27 @@ bool generatePointCloud(const cv::Mat& disparityMap,
         pointCloud.clear();
         colors.clear();
 
+        // Reproject the whole disparity map to 3D in one call
+        cv::Mat points3D;
+        cv::reprojectImageTo3D(disparityMap, points3D, Q, false, CV_32F);
+
+        cv::Mat validMask = disparityMap > 0;
+        size_t validCount = static_cast<size_t>(cv::countNonZero(validMask));
+        pointCloud.reserve(validCount);
+        colors.reserve(validCount);
+
         for (int y = 0; y < disparityMap.rows; y++) {
+            const float* disparityRow = disparityMap.ptr<float>(y);
+            const cv::Vec3f* pointRow = points3D.ptr<cv::Vec3f>(y);
+            const cv::Vec3b* colorRow = leftImage.ptr<cv::Vec3b>(y);
+
             for (int x = 0; x < disparityMap.cols; x++) {
-                float disparity = disparityMap.at<float>(y, x);
-                
-                if (disparity > 0) {  // Valid disparity
-                    // Convert to 3D point
-                    cv::Mat point3D_h = Q * (cv::Mat_<double>(4,1) << x, y, disparity, 1);
-                    cv::Point3f point3D;
-                    point3D.x = static_cast<float>(point3D_h.at<double>(0,0) / point3D_h.at<double>(3,0));
-                    point3D.y = static_cast<float>(point3D_h.at<double>(1,0) / point3D_h.at<double>(3,0));
-                    point3D.z = static_cast<float>(point3D_h.at<double>(2,0) / point3D_h.at<double>(3,0));
+                if (disparityRow[x] > 0) {  // Valid disparity
+                    const cv::Vec3f& point3D = pointRow[x];
+                    pointCloud.push_back(cv::Point3f(point3D[0], point3D[1], point3D[2]));
 
                     // Get color from left image
-                    cv::Vec3b color = leftImage.at<cv::Vec3b>(y, x);
-
-                    pointCloud.push_back(point3D);
-                    colors.push_back(color);
+                    colors.push_back(colorRow[x]);
                 }
             }
         }
@@ -215,7 +227,11 @@ bool savePointCloud(const std::vector<cv::Point3f>& pointCloud,
                    const std::string& filename,
                    int format) {
     try {
-        std::ofstream file(filename);
+        // Use a 1 MiB write buffer (must be set before open and outlive the stream)
+        std::vector<char> writeBuffer(1 << 20);
+        std::ofstream file;
+        file.rdbuf()->pubsetbuf(writeBuffer.data(), static_cast<std::streamsize>(writeBuffer.size()));
+        file.open(filename);
         if (!file.is_open()) {
             std::cerr << "Failed to create output file: " << filename << std::endl;
             return false;
@@ -236,17 +252,17 @@ bool savePointCloud(const std::vector<cv::Point3f>& pointCloud,
 
             for (size_t i = 0; i < pointCloud.size(); i++) {
                 file << pointCloud[i].x << " " << pointCloud[i].y << " " << pointCloud[i].z << " ";
-                file << static_cast<int>(colors[i][2]) << " " << static_cast<int>(colors[i][1]) << " " << static_cast<int>(colors[i][0]) << std::endl;
+                file << static_cast<int>(colors[i][2]) << " " << static_cast<int>(colors[i][1]) << " " << static_cast<int>(colors[i][0]) << "\n";
             }
         } else if (format == XYZ_FORMAT) {
             // XYZ format
             for (size_t i = 0; i < pointCloud.size(); i++) {
-                file << pointCloud[i].x << " " << pointCloud[i].y << " " << pointCloud[i].z << std::endl;
+                file << pointCloud[i].x << " " << pointCloud[i].y << " " << pointCloud[i].z << "\n";
             }
         } else if (format == OBJ_FORMAT) {
             // OBJ format (vertices only)
             for (size_t i = 0; i < pointCloud.size(); i++) {
-                file << "v " << pointCloud[i].x << " " << pointCloud[i].y << " " << pointCloud[i].z << std::endl;
+                file << "v " << pointCloud[i].x << " " << pointCloud[i].y << " " << pointCloud[i].z << "\n";
             }
         }
 
@@ -263,23 +279,25 @@ int filterPointCloud(std::vector<cv::Point3f>& pointCloud,
                     std::vector<cv::Vec3b>& colors,
                     float maxDistance) {
     try {
-        std::vector<cv::Point3f> filteredPoints;
-        std::vector<cv::Vec3b> filteredColors;
+        // Compact in place, comparing squared distance to avoid sqrt
+        const float maxDistanceSq = maxDistance * maxDistance;
+        size_t kept = 0;
 
         for (size_t i = 0; i < pointCloud.size(); i++) {
-            cv::Point3f& point = pointCloud[i];
-            float distance = std::sqrt(point.x * point.x + point.y * point.y + point.z * point.z);
+            const cv::Point3f& point = pointCloud[i];
+            float distanceSq = point.x * point.x + point.y * point.y + point.z * point.z;
             
             // Filter by distance and reasonable Z values
-            if (distance < maxDistance && point.z > 0 && point.z < maxDistance && 
+            if (distanceSq < maxDistanceSq && point.z > 0 && point.z < maxDistance && 
                 std::abs(point.x) < maxDistance && std::abs(point.y) < maxDistance) {
-                filteredPoints.push_back(point);
-                filteredColors.push_back(colors[i]);
+                pointCloud[kept] = point;
+                colors[kept] = colors[i];
+                kept++;
             }
         }
 
-        pointCloud = filteredPoints;
-        colors = filteredColors;
+        pointCloud.resize(kept);
+        colors.resize(kept);
 
         return static_cast<int>(pointCloud.size());
 
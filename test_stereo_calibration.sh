@@ -10,7 +10,7 @@ echo
 PROGRAM="./build/bin/stereo_calibration_program"
 if [ ! -f "$PROGRAM" ]; then
     echo "错误：程序未找到，请先编译 (Error: Program not found, please build first)"
-    echo "运行：cd build && make stereo_calibration_program"
+    echo '运行：cd build && make -j"$(getconf _NPROCESSORS_ONLN)" stereo_calibration_program'
     exit 1
 fi
 